@@ -37,6 +37,16 @@ class AgentStep:
         self.prompt_node_response = prompt_node_response
         self.transcript = transcript
 
+    @property
+    def final_answer_pattern(self) -> str:
+        return self._final_answer_pattern.pattern
+
+    @final_answer_pattern.setter
+    def final_answer_pattern(self, final_answer_pattern: str):
+        self._final_answer_pattern = re.compile(final_answer_pattern)
+        self._parsed_response: Optional[str] = None
+        self._parsed_final_answer: Optional[str] = None
+
     def create_next_step(self, prompt_node_response: Any, current_step: Optional[int] = None) -> AgentStep:
         """
         Creates the next agent step based on the current step and the PromptNode response.
@@ -133,15 +143,19 @@ class AgentStep:
 
         :return: The final answer as a string if a match is found, otherwise None.
         """
+        # The Agent checks is_last() more than once per step, so we only parse each response once
+        if self._parsed_response is self.prompt_node_response:
+            return self._parsed_final_answer
+
         # Search for a match with the final answer pattern in the prompt node response
-        final_answer_match = re.search(self.final_answer_pattern, self.prompt_node_response)
+        final_answer_match = self._final_answer_pattern.search(self.prompt_node_response)
 
+        final_answer = None
         if final_answer_match:
             # If a match is found, get the first group (i.e., the content inside the parentheses of the regex pattern)
-            final_answer = final_answer_match.group(1)
+            # and remove leading/trailing quotes and whitespaces
+            final_answer = final_answer_match.group(1).strip('" ')
 
-            # Remove leading/trailing quotes and whitespaces, then return the final answer
-            return final_answer.strip('" ')  # type: ignore
-        else:
-            # If no match is found, return None
-            return None
+        self._parsed_response = self.prompt_node_response
+        self._parsed_final_answer = final_answer
+        return final_answer
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from collections import OrderedDict
 from collections.abc import Iterable, Callable
-from hashlib import md5
+from functools import partial
+from hashlib import md5, sha256
 from typing import List, Optional, Union, Dict, Any, Tuple
 
 from events import Events
@@ -138,6 +141,23 @@ class ToolsManager:
     def tools(self):
         return self._tools
 
+    def add_tool(self, tool: Tool):
+        """
+        Adds a tool to the ToolsManager. Any previously added tool with the same name is overwritten.
+
+        :param tool: The tool to add.
+        """
+        self._tools[tool.name] = tool
+
+    @property
+    def tool_pattern(self) -> str:
+        return self._tool_pattern.pattern
+
+    @tool_pattern.setter
+    def tool_pattern(self, tool_pattern: str):
+        # compiled once here because the pattern is matched against every response the Agent generates
+        self._tool_pattern = re.compile(tool_pattern)
+
     def get_tool_names(self) -> str:
         """
         Returns a string with the names of all registered tools.
@@ -184,7 +204,7 @@ class ToolsManager:
         :param llm_response: The PromptNode response.
         :return: A tuple containing the tool name and the tool input.
         """
-        tool_match = re.search(self.tool_pattern, llm_response)
+        tool_match = self._tool_pattern.search(llm_response)
         if tool_match:
             tool_name = tool_match.group(1)
             tool_input = tool_match.group(2) or tool_match.group(3)
@@ -218,6 +238,7 @@ class Agent:
         max_steps: int = 8,
         final_answer_pattern: str = r"Final Answer\s*:\s*(.*)",
         streaming: bool = True,
+        response_cache_size: int = 0,
     ):
         """
          Creates an Agent instance.
@@ -240,6 +261,10 @@ class Agent:
         :param streaming: Whether to use streaming or not. If True, the Agent will stream response tokens from the LLM.
         If False, the Agent will wait for the LLM to finish generating the response and then process it. The default is
         True.
+        :param response_cache_size: The number of PromptNode responses the Agent keeps in memory. If the Agent builds
+        a prompt it has already sent to the LLM, it reuses the cached response instead of invoking the LLM again. Only
+        enable this with a deterministic PromptNode (for example, temperature 0). The cache is cleared whenever a
+        different PromptNode is assigned to the Agent's `prompt_node`. The default is 0, which disables the cache.
         """
         self.max_steps = max_steps
         self.tm = tools_manager or ToolsManager()
@@ -247,6 +272,8 @@ class Agent:
         self.callback_manager = Events(
             ("on_agent_start", "on_agent_step", "on_agent_finish", "on_agent_final_answer", "on_new_token")
         )
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict[str, List[str]] = OrderedDict()
         self.prompt_node = prompt_node
         prompt_template = prompt_template or prompt_node.default_prompt_template or "zero-shot-react"
         resolved_prompt_template = prompt_node.get_prompt_template(prompt_template)
@@ -264,6 +291,16 @@ class Agent:
         self.last_hash = None
         self.update_hash()
 
+    @property
+    def prompt_node(self) -> PromptNode:
+        return self._prompt_node
+
+    @prompt_node.setter
+    def prompt_node(self, prompt_node: PromptNode):
+        # Cached responses came from the previous PromptNode and don't apply to another model or configuration
+        self._prompt_node = prompt_node
+        self._response_cache.clear()
+
     def update_hash(self):
         """
         Used for telemetry. Hashes the tool classnames to send an event only when they change.
@@ -324,7 +361,7 @@ class Agent:
             logger.warning(
                 "The agent already has a tool named '%s'. The new tool will overwrite the existing one.", tool.name
             )
-        self.tm.tools[tool.name] = tool
+        self.tm.add_tool(tool)
 
     def has_tool(self, tool_name: str) -> bool:
         """
@@ -351,12 +388,7 @@ class Agent:
                         `{"Retriever": {"top_k": 10}, "Reader": {"top_k": 3}}`.
                         You can only pass parameters to tools that are pipelines, but not nodes.
         """
-        try:
-            if self.hash != self.last_hash:
-                self.last_hash = self.hash
-                send_event(event_name="Agent", event_properties={"llm.agent_hash": self.hash})
-        except Exception as exc:
-            logger.debug("Telemetry exception: %s", exc)
+        self._send_agent_event()
 
         self.callback_manager.on_agent_start(name=self.prompt_template.name, query=query, params=params)
         agent_step = self.create_agent_step(max_steps)
@@ -369,6 +401,60 @@ class Agent:
         self.callback_manager.on_agent_final_answer(final_answer)
         return final_answer
 
+    async def arun(
+        self, query: str, max_steps: Optional[int] = None, params: Optional[dict] = None
+    ) -> Dict[str, Union[str, List[Answer]]]:
+        """
+        Drop-in replacement asyncio version of the `run` method, see there for documentation.
+
+        The PromptNode is invoked asynchronously if its invocation layer supports it. Tools are blocking, so they run
+        in the event loop's default executor.
+        """
+        self._send_agent_event()
+
+        self.callback_manager.on_agent_start(name=self.prompt_template.name, query=query, params=params)
+        agent_step = self.create_agent_step(max_steps)
+        try:
+            while not agent_step.is_last():
+                agent_step = await self._astep(query, agent_step, params)
+        finally:
+            self.callback_manager.on_agent_finish(agent_step)
+        final_answer = agent_step.final_answer(query=query)
+        self.callback_manager.on_agent_final_answer(final_answer)
+        return final_answer
+
+    def run_batch(
+        self, queries: List[str], max_steps: Optional[int] = None, params: Optional[dict] = None
+    ) -> List[Dict[str, Union[str, List[Answer]]]]:
+        """
+        Runs the Agent on several queries concurrently. The results are returned in the same order as the queries.
+
+        All queries share the Agent's tools and memory, so only use this method with tools that are thread-safe and
+        with a memory that doesn't depend on the order of the queries, such as the default `NoMemory`.
+        This method starts its own event loop. If you're already in a running event loop, await `arun_batch` instead.
+
+        :param queries: The search queries.
+        :param max_steps: The number of times the Agent can run a tool +1 to infer it knows the final answer.
+        :param params: A dictionary of parameters you want to pass to the tools that are pipelines. See `run()`.
+        """
+        return asyncio.run(self.arun_batch(queries=queries, max_steps=max_steps, params=params))
+
+    async def arun_batch(
+        self, queries: List[str], max_steps: Optional[int] = None, params: Optional[dict] = None
+    ) -> List[Dict[str, Union[str, List[Answer]]]]:
+        """
+        Drop-in replacement asyncio version of the `run_batch` method, see there for documentation.
+        """
+        return list(await asyncio.gather(*(self.arun(query, max_steps=max_steps, params=params) for query in queries)))
+
+    def _send_agent_event(self):
+        try:
+            if self.hash != self.last_hash:
+                self.last_hash = self.hash
+                send_event(event_name="Agent", event_properties={"llm.agent_hash": self.hash})
+        except Exception as exc:
+            logger.debug("Telemetry exception: %s", exc)
+
     def _step(self, query: str, current_step: AgentStep, params: Optional[dict] = None):
         # plan next step using the LLM
         prompt_node_response = self._plan(query, current_step)
@@ -388,6 +474,30 @@ class Agent:
         next_step.completed(observation)
         return next_step
 
+    async def _astep(self, query: str, current_step: AgentStep, params: Optional[dict] = None):
+        # plan next step using the LLM
+        prompt_node_response = await self._aplan(query, current_step)
+
+        # from the LLM response, create the next step
+        next_step = current_step.create_next_step(prompt_node_response)
+        self.callback_manager.on_agent_step(next_step)
+
+        # run the tool selected by the LLM, tools are blocking so we run them in an executor
+        observation = None
+        if not next_step.is_last():
+            loop = asyncio.get_running_loop()
+            observation = await loop.run_in_executor(
+                None, partial(self.tm.run_tool, next_step.prompt_node_response, params)
+            )
+
+        # save the input, output and observation to memory (if memory is enabled)
+        memory_data = self.prepare_data_for_memory(input=query, output=prompt_node_response, observation=observation)
+        self.memory.save(data=memory_data)
+
+        # update the next step with the observation
+        next_step.completed(observation)
+        return next_step
+
     def _plan(self, query, current_step):
         # first resolve prompt template params
         template_params = self.prompt_parameters_resolver(query=query, agent=self, agent_step=current_step)
@@ -395,14 +505,60 @@ class Agent:
         # check for template parameters mismatch
         self.check_prompt_template(template_params)
 
+        # reuse the response if we already sent the same prompt to the LLM
+        cache_key, cached_response = self._get_cached_response(template_params)
+        if cached_response is not None:
+            return cached_response
+
         # invoke via prompt node
         prompt_node_response = self.prompt_node.prompt(
             prompt_template=self.prompt_template,
             stream_handler=AgentTokenStreamingHandler(self.callback_manager),
             **template_params,
         )
+        self._cache_response(cache_key, prompt_node_response)
+        return prompt_node_response
+
+    async def _aplan(self, query, current_step):
+        # first resolve prompt template params
+        template_params = self.prompt_parameters_resolver(query=query, agent=self, agent_step=current_step)
+
+        # check for template parameters mismatch
+        self.check_prompt_template(template_params)
+
+        # reuse the response if we already sent the same prompt to the LLM
+        cache_key, cached_response = self._get_cached_response(template_params)
+        if cached_response is not None:
+            return cached_response
+
+        # invoke via prompt node
+        prompt_node_response = await self.prompt_node._aprompt(
+            prompt_template=self.prompt_template,
+            stream_handler=AgentTokenStreamingHandler(self.callback_manager),
+            **template_params,
+        )
+        self._cache_response(cache_key, prompt_node_response)
         return prompt_node_response
 
+    def _get_cached_response(self, template_params: Dict[str, Any]) -> Tuple[Optional[str], Optional[List[str]]]:
+        if self.response_cache_size <= 0:
+            return None, None
+        # The prompt text and the resolved parameters fully determine the prompt sent to the LLM
+        prompt_inputs = f"{self.prompt_template.prompt_text}{sorted(template_params.items())}"
+        cache_key = sha256(prompt_inputs.encode()).hexdigest()
+        if cache_key not in self._response_cache:
+            return cache_key, None
+        self._response_cache.move_to_end(cache_key)
+        prompt_node_response = list(self._response_cache[cache_key])
+        self.callback_manager.on_new_token(prompt_node_response[0] if prompt_node_response else "")
+        return cache_key, prompt_node_response
+
+    def _cache_response(self, cache_key: Optional[str], prompt_node_response: List[str]) -> None:
+        if cache_key and prompt_node_response:
+            self._response_cache[cache_key] = list(prompt_node_response)
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
     def create_agent_step(self, max_steps: Optional[int] = None) -> AgentStep:
         """
         Create an AgentStep object. Override this method to customize the AgentStep class used by the Agent.
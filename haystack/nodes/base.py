@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import Any, Optional, Dict, List, Tuple, Union, Callable, Type
+from typing import Any, Optional, Dict, FrozenSet, List, Tuple, Union, Callable, Type
 
 from copy import deepcopy
 from abc import ABC, abstractmethod
 from functools import wraps
 import inspect
 import logging
+import weakref
 
 from haystack.schema import Document, MultiLabel
 from haystack.errors import PipelineSchemaError
@@ -48,6 +49,41 @@ def exportable_to_yaml(init_func):
     return wrapper_exportable_to_yaml
 
 
+# Caches keyed on component classes and on the functions behind run methods. Weak keys let a cache entry
+# go away together with its key, for example for components defined at runtime.
+_init_signatures: "weakref.WeakKeyDictionary[Type[BaseComponent], inspect.Signature]" = weakref.WeakKeyDictionary()
+_run_signature_args: "weakref.WeakKeyDictionary[Callable, FrozenSet[str]]" = weakref.WeakKeyDictionary()
+
+
+def _get_init_signature(component_class: Type[BaseComponent]) -> inspect.Signature:
+    """
+    Returns the signature of a component class' __init__. The signature only depends on the class, so it's computed
+    once per class instead of on every call to `get_params()`.
+    """
+    signature = _init_signatures.get(component_class)
+    if signature is None:
+        signature = inspect.signature(component_class)
+        _init_signatures[component_class] = signature
+    return signature
+
+
+def _get_run_signature_args(run_method: Callable) -> FrozenSet[str]:
+    """
+    Returns the argument names of a run method. Pipelines dispatch to the same run methods over and over, so the
+    names are computed once per underlying function instead of inspecting the signature on every node run.
+    """
+    func = getattr(run_method, "__func__", run_method)
+    try:
+        signature_args = _run_signature_args.get(func)
+    except TypeError:
+        # not weak-referenceable, for example a builtin: inspect it every time
+        return frozenset(inspect.signature(run_method).parameters.keys())
+    if signature_args is None:
+        signature_args = frozenset(inspect.signature(run_method).parameters.keys())
+        _run_signature_args[func] = signature_args
+    return signature_args
+
+
 class BaseComponent(ABC):
     """
     A base class for implementing nodes in a Pipeline.
@@ -104,7 +140,7 @@ class BaseComponent(ABC):
         return self._component_config["type"]
 
     def get_params(self, return_defaults: bool = False) -> Dict[str, Any]:
-        component_signature = dict(inspect.signature(self.__class__).parameters)
+        component_signature = _get_init_signature(self.__class__).parameters
         params: Dict[str, Any] = {}
         for key, value in self._component_config["params"].items():
             if value != component_signature[key].default or return_defaults:
@@ -219,7 +255,7 @@ class BaseComponent(ABC):
         arguments = deepcopy(kwargs)
         params = arguments.get("params") or {}
 
-        run_signature_args = inspect.signature(run_method).parameters.keys()
+        run_signature_args = _get_run_signature_args(run_method)
 
         run_params: Dict[str, Any] = {}
         for key, value in params.items():
@@ -290,7 +326,7 @@ class BaseComponent(ABC):
         arguments = deepcopy(kwargs)
         params = arguments.get("params") or {}
 
-        run_signature_args = inspect.signature(run_method).parameters.keys()
+        run_signature_args = _get_run_signature_args(run_method)
 
         run_params: Dict[str, Any] = {}
         for key, value in params.items():
@@ -420,6 +420,8 @@ class PromptTemplate(BasePromptTemplate, ABC):
 
         ast_transformer = _FstringParamsTransformer()
         self._ast_expression = ast.fix_missing_locations(ast_transformer.visit(self._ast_expression))
+        # The template text doesn't change after init, so we compile it once instead of on every fill()
+        self._compiled_expression = compile(self._ast_expression, filename="<string>", mode="eval")
         self._prompt_params_functions = ast_transformer.prompt_params_functions
         self._used_functions = ast_validator.used_functions
 
@@ -571,10 +573,11 @@ class PromptTemplate(BasePromptTemplate, ABC):
                 if len(value) == 1:
                     prompt_context_copy[key] = value * max_len
 
+        prompt_context_keys = tuple(prompt_context_copy.keys())
         for prompt_context_values in zip(*prompt_context_copy.values()):
-            template_input = {key: prompt_context_values[idx] for idx, key in enumerate(prompt_context_copy.keys())}
+            template_input = dict(zip(prompt_context_keys, prompt_context_values))
             prompt_prepared: str = eval(  # pylint: disable=eval-used
-                compile(self._ast_expression, filename="<string>", mode="eval"), self.globals, template_input
+                self._compiled_expression, self.globals, template_input
             )
             yield prompt_prepared
 
@@ -594,3 +597,13 @@ class PromptTemplate(BasePromptTemplate, ABC):
 
     def __repr__(self):
         return f"PromptTemplate(name={self.name}, prompt_text={self.prompt_text}, prompt_params={self.prompt_params})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Code objects can't be pickled, we recompile the expression in __setstate__ instead
+        state = self.__dict__.copy()
+        state.pop("_compiled_expression", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compiled_expression = compile(self._ast_expression, filename="<string>", mode="eval")
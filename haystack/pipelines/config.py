@@ -1,10 +1,10 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import re
 import os
 import logging
 from pathlib import Path
-from copy import copy
+from copy import copy, deepcopy
 
 import yaml
 import networkx as nx
@@ -19,6 +19,9 @@ from haystack.errors import PipelineError, PipelineConfigError, PipelineSchemaEr
 
 logger = logging.getLogger(__name__)
 
+# Parsed YAML configs by path, together with the file stats they were parsed from. See read_pipeline_config_from_yaml()
+_PIPELINE_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
 
 VALID_KEY_REGEX = re.compile(r"^[-\w/\\.:*]+$")
 VALID_VALUE_REGEX = re.compile(r"^[-\w/\\.:* \[\]]+$")
@@ -96,11 +99,21 @@ def read_pipeline_config_from_yaml(path: Path) -> Dict[str, Any]:
     """
     Parses YAML files into Python objects.
     Fails if the file does not exist.
+
+    The parsed config is cached until the file changes on disk, so loading the same YAML repeatedly
+    (for example, several pipelines from one file) parses it only once. Each call returns its own copy.
     """
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Not found: {path}")
-    with open(path, "r", encoding="utf-8") as stream:
-        return yaml.safe_load(stream)
+    cache_key = os.path.abspath(path)
+    stat = os.stat(path)
+    file_stats = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _PIPELINE_CONFIG_CACHE.get(cache_key)
+    if cached is None or cached[0] != file_stats:
+        with open(path, "r", encoding="utf-8") as stream:
+            cached = (file_stats, yaml.safe_load(stream))
+        _PIPELINE_CONFIG_CACHE[cache_key] = cached
+    return deepcopy(cached[1])
 
 
 def build_component_dependency_graph(
@@ -3,7 +3,6 @@ from typing import Any, Dict, Optional, List, Union
 import uuid
 import logging
 from pathlib import Path
-import json
 
 import yaml
 import posthog
@@ -89,14 +88,13 @@ class Telemetry:
         """
         event_properties = event_properties or {}
         dynamic_specs = collect_dynamic_system_specs()
+        properties = {**self.event_properties, **dynamic_specs, **event_properties}
         try:
             posthog.capture(
                 distinct_id=self.user_id,
                 event=event_name,
-                # loads/dumps to sort the keys
-                properties=json.loads(
-                    json.dumps({**self.event_properties, **dynamic_specs, **event_properties}, sort_keys=True)
-                ),
+                # PostHog serializes the properties itself, so we only sort the keys here
+                properties=dict(sorted(properties.items())),
             )
         except Exception as e:
             logger.debug("Telemetry couldn't make a POST request to PostHog.", exc_info=e)
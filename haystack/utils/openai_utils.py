@@ -3,6 +3,7 @@ import os
 import logging
 import platform
 import json
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Union, Tuple, Optional, List, cast
 
 import httpx
@@ -16,6 +17,10 @@ from haystack.environment import (
     HAYSTACK_REMOTE_API_MAX_RETRIES,
     HAYSTACK_REMOTE_API_TIMEOUT_SEC,
 )
+from haystack.lazy_imports import LazyImport
+
+with LazyImport() as orjson_import:
+    import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,29 @@ OPENAI_MAX_RETRIES = int(os.environ.get(HAYSTACK_REMOTE_API_MAX_RETRIES, 5))
 OPENAI_MODERATION_URL = "https://api.openai.com/v1/moderations"
 
 
+def _create_openai_session() -> requests.Session:
+    """
+    Creates the session shared by all OpenAI requests. It doesn't store cookies, so no state from one response is
+    sent along with the next request.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _reset_openai_session():
+    global _openai_session
+    _openai_session = _create_openai_session()
+
+
+# Shared by all OpenAI requests so that connections are kept alive and reused instead of paying for a new
+# TCP and TLS handshake on every call, for example on each step of an Agent
+_openai_session = _create_openai_session()
+if hasattr(os, "register_at_fork"):
+    # Forked workers must not share the parent's open connections
+    os.register_at_fork(after_in_child=_reset_openai_session)
+
+
 def load_openai_tokenizer(tokenizer_name: str):
     """Load either the tokenizer from tiktoken (if the library is available) or fallback to the GPT2TokenizerFast
     from the transformers library.
@@ -98,6 +126,16 @@ def _openai_text_completion_tokenization_details(model_name: str):
     return tokenizer_name, max_tokens_limit
 
 
+def _parse_json_response(content: Union[str, bytes]):
+    """
+    Parses an OpenAI JSON response body. Uses `orjson` if it's installed, as it's considerably faster than the
+    standard library for the many small responses an Agent or a PromptNode receives.
+    """
+    if orjson_import.is_successful():
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 @tenacity.retry(
     reraise=True,
     retry=tenacity.retry_if_exception_type(OpenAIError)
@@ -121,9 +159,11 @@ def openai_request(
     :param timeout: The timeout length of the request. The default is 30s.
     :param read_response: Whether to read the response as JSON. The default is True.
     """
-    response = requests.request("POST", url, headers=headers, data=json.dumps(payload), timeout=timeout, **kwargs)
+    response = _openai_session.request(
+        "POST", url, headers=headers, data=json.dumps(payload), timeout=timeout, **kwargs
+    )
     if read_response:
-        json_response = json.loads(response.text)
+        json_response = _parse_json_response(response.content)
 
     if response.status_code != 200:
         openai_error: OpenAIError
@@ -170,7 +210,7 @@ async def openai_async_request(
         )
 
     if read_response:
-        json_response = json.loads(response.text)
+        json_response = _parse_json_response(response.content)
 
     if response.status_code != 200:
         openai_error: OpenAIError
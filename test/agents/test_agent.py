@@ -433,3 +433,72 @@ def test_agent_prompt_template_missing_parameters(caplog):
     agent = Agent(prompt_node=mock_prompt_node)
     agent.check_prompt_template({"transcript": "test"})
     assert not caplog.text
+
+
+@pytest.mark.unit
+def test_agent_response_cache():
+    mock_prompt_node = Mock(spec=PromptNode)
+    mock_prompt_node.get_prompt_template.return_value = PromptTemplate(prompt="{query} {transcript}")
+    mock_prompt_node.prompt.return_value = ["Final Answer: 42"]
+
+    agent = Agent(prompt_node=mock_prompt_node, response_cache_size=1)
+    assert agent.run("What is the answer?")["answers"][0].answer == "42"
+    assert agent.run("What is the answer?")["answers"][0].answer == "42"
+    assert mock_prompt_node.prompt.call_count == 1
+
+    # a different prompt evicts the only cache entry
+    agent.run("What is the question?")
+    agent.run("What is the answer?")
+    assert mock_prompt_node.prompt.call_count == 3
+
+
+@pytest.mark.unit
+def test_agent_response_cache_cleared_when_prompt_node_changes():
+    mock_prompt_node = Mock(spec=PromptNode)
+    mock_prompt_node.get_prompt_template.return_value = PromptTemplate(prompt="{query} {transcript}")
+    mock_prompt_node.prompt.return_value = ["Final Answer: 42"]
+    agent = Agent(prompt_node=mock_prompt_node, response_cache_size=1)
+    agent.run("What is the answer?")
+
+    other_prompt_node = Mock(spec=PromptNode)
+    other_prompt_node.prompt.return_value = ["Final Answer: 43"]
+    agent.prompt_node = other_prompt_node
+
+    assert agent.run("What is the answer?")["answers"][0].answer == "43"
+    assert other_prompt_node.prompt.call_count == 1
+
+
+@pytest.mark.unit
+def test_agent_response_cache_disabled_by_default():
+    mock_prompt_node = Mock(spec=PromptNode)
+    mock_prompt_node.get_prompt_template.return_value = PromptTemplate(prompt="{query} {transcript}")
+    mock_prompt_node.prompt.return_value = ["Final Answer: 42"]
+
+    agent = Agent(prompt_node=mock_prompt_node)
+    agent.run("What is the answer?")
+    agent.run("What is the answer?")
+    assert mock_prompt_node.prompt.call_count == 2
+
+
+@pytest.mark.unit
+def test_agent_run_batch():
+    mock_prompt_node = Mock(spec=PromptNode)
+    mock_prompt_node.get_prompt_template.return_value = PromptTemplate(prompt="{query} {transcript}")
+
+    def mock_aprompt(query: str, transcript: str, **kwargs):
+        # use the Echo tool first, then answer with its observation
+        if "Observation:" in transcript:
+            return [f"Final Answer: {transcript.split('Observation: ')[1].split()[0]}"]
+        return [f"Tool: Echo\nTool Input: {query.split()[0]}"]
+
+    mock_prompt_node._aprompt.side_effect = mock_aprompt
+
+    agent = Agent(prompt_node=mock_prompt_node)
+    agent.add_tool(Tool(name="Echo", pipeline_or_node=lambda tool_input: tool_input, description="Echoes the input"))
+    results = agent.run_batch(["first query", "second query"])
+
+    assert [result["query"] for result in results] == ["first query", "second query"]
+    assert [result["answers"][0].answer for result in results] == ["first", "second"]
+    assert "Observation: first" in results[0]["transcript"]
+    assert "Observation: second" in results[1]["transcript"]
+    mock_prompt_node.prompt.assert_not_called()
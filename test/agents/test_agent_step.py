@@ -98,6 +98,13 @@ def test_parse_final_answer(agent_step):
     assert agent_step.parse_final_answer() is None
 
 
+@pytest.mark.unit
+def test_parse_final_answer_after_response_changes(agent_step):
+    assert agent_step.parse_final_answer() == "Hello"
+    agent_step.prompt_node_response = "Goodbye"
+    assert agent_step.parse_final_answer() == "Goodbye"
+
+
 @pytest.mark.unit
 def test_format_react_answer():
     step = AgentStep(
@@ -44,6 +44,27 @@ def test_get_tool_names_with_descriptions(tools_manager):
     assert tools_manager.get_tool_names_with_descriptions() == expected_output
 
 
+@pytest.mark.unit
+def test_add_tool_updates_tool_names(tools_manager):
+    assert tools_manager.get_tool_names() == "ToolA, ToolB"
+    tools_manager.add_tool(Tool(name="ToolC", pipeline_or_node=mock.Mock(), description="Tool C Description"))
+    assert tools_manager.get_tool_names() == "ToolA, ToolB, ToolC"
+    assert tools_manager.get_tool_names_with_descriptions().endswith("\nToolC: Tool C Description")
+
+
+@pytest.mark.unit
+def test_tool_names_reflect_direct_changes_to_tools(tools_manager):
+    tools_manager.get_tool_names()
+    tools_manager.tools["ToolC"] = Tool(name="ToolC", pipeline_or_node=mock.Mock(), description="Tool C Description")
+    del tools_manager.tools["ToolA"]
+    tools_manager.tools["ToolB"].description = "New Tool B Description"
+
+    assert tools_manager.get_tool_names() == "ToolB, ToolC"
+    assert tools_manager.get_tool_names_with_descriptions() == (
+        "ToolB: New Tool B Description\nToolC: Tool C Description"
+    )
+
+
 @pytest.mark.unit
 def test_extract_tool_name_and_tool_input(tools_manager):
     examples = [
@@ -164,6 +185,16 @@ def test_extract_tool_name_and_empty_tool_input(tools_manager):
         assert tool_name == "Search" and tool_input == ""
 
 
+@pytest.mark.unit
+def test_custom_tool_pattern(tools_manager):
+    tools_manager.tool_pattern = r"Action:\s*(\w+)\s*Action Input:\s*(?:\"([\s\S]*?)\"|((?:.|\n)*))\s*"
+    assert tools_manager.tool_pattern.startswith("Action:")
+
+    tool_name, tool_input = tools_manager.extract_tool_name_and_tool_input("Action: Search\nAction Input: Berlin")
+    assert tool_name == "Search" and tool_input == "Berlin"
+    assert tools_manager.extract_tool_name_and_tool_input("Tool: Search\nTool Input: Berlin") == (None, None)
+
+
 @pytest.mark.unit
 def test_node_as_tool():
     # test that a component can be used as a tool
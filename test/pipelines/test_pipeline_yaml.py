@@ -5,9 +5,11 @@ import pytest
 import json
 import inspect
 import networkx as nx
+import yaml
 from enum import Enum
 from pydantic.dataclasses import dataclass
 from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
 
 import haystack
 from haystack import Pipeline
@@ -15,6 +17,7 @@ from haystack.nodes import _json_schema
 from haystack.nodes import FileTypeClassifier
 from haystack.errors import HaystackError, PipelineConfigError, PipelineSchemaError, DocumentStoreError
 from haystack.nodes.base import BaseComponent
+from haystack.pipelines.config import read_pipeline_config_from_yaml
 
 from ..conftest import MockNode, MockDocumentStore, MockReader, MockRetriever
 from .. import conftest
@@ -195,6 +198,23 @@ def test_load_yaml_invalid_yaml(tmp_path):
         Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
 
 
+@pytest.mark.unit
+def test_read_pipeline_config_from_yaml_is_cached_until_file_changes(tmp_path, monkeypatch):
+    config_path = tmp_path / "tmp_config.yml"
+    config_path.write_text("version: ignore\ncomponents: []\n")
+    mock_safe_load = Mock(wraps=yaml.safe_load)
+    monkeypatch.setattr(yaml, "safe_load", mock_safe_load)
+
+    first = read_pipeline_config_from_yaml(config_path)
+    first["components"].append("mutated by the caller")
+    assert read_pipeline_config_from_yaml(config_path) == {"version": "ignore", "components": []}
+    assert mock_safe_load.call_count == 1
+
+    config_path.write_text("version: ignore\ncomponents: []\npipelines: []\n")
+    assert read_pipeline_config_from_yaml(config_path)["pipelines"] == []
+    assert mock_safe_load.call_count == 2
+
+
 @pytest.mark.unit
 def test_load_yaml_missing_version(tmp_path):
     with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
@@ -1,5 +1,6 @@
 from typing import Set, Type, List
 import textwrap
+import pickle
 import os
 from unittest.mock import patch, MagicMock
 
@@ -186,6 +187,13 @@ def test_prompt_template_repr():
     assert str(p) == desired_repr
 
 
+@pytest.mark.unit
+def test_prompt_template_can_be_pickled():
+    p = PromptTemplate("Here is variable {baz}")
+    unpickled = pickle.loads(pickle.dumps(p))
+    assert list(unpickled.fill(baz="foo")) == ["Here is variable foo"]
+
+
 @pytest.mark.unit
 @patch("haystack.nodes.prompt.prompt_node.PromptModel")
 def test_prompt_template_deserialization(mock_prompt_model):
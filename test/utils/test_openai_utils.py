@@ -3,6 +3,7 @@ import copy
 from unittest.mock import patch
 
 import pytest
+import responses
 from tenacity import wait_none
 
 from haystack.errors import OpenAIError, OpenAIRateLimitError, OpenAIUnauthorizedError
@@ -10,6 +11,7 @@ from haystack.utils.openai_utils import (
     openai_request,
     _openai_text_completion_tokenization_details,
     check_openai_policy_violation,
+    _parse_json_response,
 )
 
 
@@ -56,53 +58,82 @@ def test_openai_text_completion_tokenization_details_gpt_4_32k():
 
 
 @pytest.mark.unit
-@patch("haystack.utils.openai_utils.requests")
-def test_openai_request_retries_generic_error(mock_requests):
-    mock_requests.request.return_value.status_code = 418
+@patch("haystack.utils.openai_utils._openai_session")
+def test_openai_request_retries_generic_error(mock_session):
+    mock_session.request.return_value.status_code = 418
 
     with pytest.raises(OpenAIError):
         # We need to use a custom wait amount otherwise the test would take forever to run
         # as the original wait time is exponential
         openai_request.retry_with(wait=wait_none())(url="some_url", headers={}, payload={}, read_response=False)
 
-    assert mock_requests.request.call_count == 5
+    assert mock_session.request.call_count == 5
 
 
 @pytest.mark.unit
-@patch("haystack.utils.openai_utils.requests")
-def test_openai_request_retries_on_rate_limit_error(mock_requests):
-    mock_requests.request.return_value.status_code = 429
+@patch("haystack.utils.openai_utils._openai_session")
+def test_openai_request_retries_on_rate_limit_error(mock_session):
+    mock_session.request.return_value.status_code = 429
 
     with pytest.raises(OpenAIRateLimitError):
         # We need to use a custom wait amount otherwise the test would take forever to run
         # as the original wait time is exponential
         openai_request.retry_with(wait=wait_none())(url="some_url", headers={}, payload={}, read_response=False)
 
-    assert mock_requests.request.call_count == 5
+    assert mock_session.request.call_count == 5
 
 
 @pytest.mark.unit
-@patch("haystack.utils.openai_utils.requests")
-def test_openai_request_does_not_retry_on_unauthorized_error(mock_requests):
-    mock_requests.request.return_value.status_code = 401
+@patch("haystack.utils.openai_utils._openai_session")
+def test_openai_request_does_not_retry_on_unauthorized_error(mock_session):
+    mock_session.request.return_value.status_code = 401
 
     with pytest.raises(OpenAIUnauthorizedError):
         # We need to use a custom wait amount otherwise the test would take forever to run
         # as the original wait time is exponential
         openai_request.retry_with(wait=wait_none())(url="some_url", headers={}, payload={}, read_response=False)
 
-    assert mock_requests.request.call_count == 1
+    assert mock_session.request.call_count == 1
 
 
 @pytest.mark.unit
-@patch("haystack.utils.openai_utils.requests")
-def test_openai_request_does_not_retry_on_success(mock_requests):
-    mock_requests.request.return_value.status_code = 200
+@patch("haystack.utils.openai_utils._openai_session")
+def test_openai_request_does_not_retry_on_success(mock_session):
+    mock_session.request.return_value.status_code = 200
     # We need to use a custom wait amount otherwise the test would take forever to run
     # as the original wait time is exponential
     openai_request.retry_with(wait=wait_none())(url="some_url", headers={}, payload={}, read_response=False)
 
-    assert mock_requests.request.call_count == 1
+    assert mock_session.request.call_count == 1
+
+
+@pytest.mark.unit
+@responses.activate
+def test_openai_request_does_not_send_cookies_from_previous_responses():
+    url = "https://api.openai.com/v1/completions"
+    responses.add(responses.POST, url, json={}, headers={"Set-Cookie": "session_id=abc; Domain=api.openai.com"})
+    responses.add(responses.POST, url, json={})
+
+    openai_request(url=url, headers={}, payload={})
+    openai_request(url=url, headers={}, payload={})
+
+    assert "Cookie" not in responses.calls[1].request.headers
+
+
+@pytest.mark.unit
+@patch("haystack.utils.openai_utils.orjson_import.is_successful", return_value=False)
+def test_parse_json_response_without_orjson(mock_is_successful):
+    assert _parse_json_response(b'{"choices": [{"text": "Hello"}]}') == {"choices": [{"text": "Hello"}]}
+
+
+@pytest.mark.unit
+@patch("haystack.utils.openai_utils.orjson", create=True)
+@patch("haystack.utils.openai_utils.orjson_import.is_successful", return_value=True)
+def test_parse_json_response_with_orjson(mock_is_successful, mock_orjson):
+    mock_orjson.loads.return_value = {"choices": [{"text": "Hello"}]}
+
+    assert _parse_json_response(b'{"choices": [{"text": "Hello"}]}') == {"choices": [{"text": "Hello"}]}
+    mock_orjson.loads.assert_called_once_with(b'{"choices": [{"text": "Hello"}]}')
 
 
 @pytest.mark.unit